@@ -7,23 +7,43 @@ age calculation, progress toward next birthday, and countdown timers.
 from __future__ import annotations
 
 import logging
-from typing import Any
-
-from datetime import timedelta
+from calendar import isleap
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import update_coordinator
-from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_BIRTH_DATE, CONF_BIRTH_TIME, DOMAIN
 
-from .const import DOMAIN
+if TYPE_CHECKING:
+    from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 
+@dataclass(slots=True)
+class _Registry:
+    """
+    Integration data stored in hass.data[DOMAIN].
+
+    Attributes:
+        coordinators: Coordinators keyed by config entry ID
+        coordinators_by_birth: Shared coordinators keyed by (birth_date, birth_time)
+    """
+
+    coordinators: dict[str, BirthdayProgressCoordinator] = field(default_factory=dict)
+    coordinators_by_birth: dict[
+        tuple[str, str | None], BirthdayProgressCoordinator
+    ] = field(default_factory=dict)
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """
     Set up the Birthday Progress integration.
@@ -36,7 +56,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         True if setup successful, False otherwise
     """
     # Domain-level setup - minimal since we use config entries
-    hass.data.setdefault(DOMAIN, {})
+    hass.data.setdefault(DOMAIN, _Registry())
     return True
 
 
@@ -51,13 +71,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Returns:
         True if setup successful, False otherwise
     """
-    # Initialize coordinator for this entry
-    coordinator = BirthdayProgressCoordinator(hass, entry)
+    registry: _Registry = hass.data[DOMAIN]
+
+    # Entries with the same birth date and time share one coordinator
+    birth_key = (entry.data.get(CONF_BIRTH_DATE), entry.data.get(CONF_BIRTH_TIME))
+    coordinator = registry.coordinators_by_birth.get(birth_key)
+    if coordinator is None:
+        coordinator = BirthdayProgressCoordinator(hass, *birth_key)
+        registry.coordinators_by_birth[birth_key] = coordinator
 
     # Store coordinator in hass.data
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    registry.coordinators[entry.entry_id] = coordinator
 
-    # Forward entry setup to sensor platform
+    # Forward entry setup to sensor platform. This must be awaited here:
+    # forwarding after setup returns is rejected by Home Assistant, which
+    # already sets up the entries of an integration concurrently.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -79,7 +107,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         # Remove coordinator from hass.data
-        hass.data[DOMAIN].pop(entry.entry_id)
+        registry: _Registry = hass.data[DOMAIN]
+        coordinator = registry.coordinators.pop(entry.entry_id)
+
+        # Drop the shared coordinator once no other entry uses it
+        if coordinator not in registry.coordinators.values():
+            registry.coordinators_by_birth.pop(
+                (coordinator.birth_date, coordinator.birth_time), None
+            )
 
     return unload_ok
 
@@ -99,27 +134,139 @@ class BirthdayProgressCoordinator(update_coordinator.DataUpdateCoordinator):
     """
     Coordinator for Birthday Progress data updates.
 
-    Handles periodic updates to refresh birthday calculations.
+    Holds the birthday data shared by all entries with the same birth date
+    and time. It does not poll: nothing here changes over time, so sensors
+    recompute derived values themselves and schedule their own state updates.
     """
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self, hass: HomeAssistant, birth_date: str, birth_time: str | None
+    ) -> None:
         """
         Initialize the coordinator.
 
         Args:
             hass: Home Assistant instance
-            entry: Configuration entry
+            birth_date: Birth date in YYYY-MM-DD format
+            birth_time: Birth time, or None if not specified
         """
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=1),
         )
-        self.entry = entry
-        self.name = entry.data.get("name", "Unknown")
-        self.birth_date = entry.data.get("birth_date")
-        self.birth_time = entry.data.get("birth_time")
+        self.birth_date = birth_date
+        self.birth_time = birth_time
+
+        # Parse once so consumers never have to reparse the stored strings
+        self.birth_datetime = self._parse_birth_datetime()
+        self.birth_month_day = (self.birth_datetime.month, self.birth_datetime.day)
+        self._is_feb29 = self.birth_month_day == (2, 29)
+
+        # Birthdays around "now", only recomputed once the next one has passed
+        self._last_birthday_dt: datetime | None = None
+        self._next_birthday_dt: datetime | None = None
+        self._last_birthday_ts = 0.0
+        self._next_birthday_ts = 0.0
+
+        # The data never changes, so the same dict is returned on every refresh
+        self._static_data: dict[str, Any] = {
+            "birth_date": self.birth_date,
+            "birth_time": self.birth_time,
+        }
+
+    def _parse_birth_datetime(self) -> datetime:
+        """
+        Parse birth date and time into a datetime object.
+
+        Returns:
+            Datetime object representing birth date/time
+        """
+        birth_date = dt_util.parse_date(self.birth_date)
+        if birth_date is None:
+            raise ValueError(f"Invalid birth date: {self.birth_date}")
+
+        birth_time = None
+        if self.birth_time:
+            birth_time = dt_util.parse_time(self.birth_time)
+            if birth_time is None:
+                _LOGGER.warning(
+                    "Invalid birth time format: %s, using midnight", self.birth_time
+                )
+
+        # Combine date and time, defaulting to midnight if no time provided
+        return dt_util.as_local(
+            datetime.combine(birth_date, birth_time or datetime.min.time())
+        )
+
+    def _birthday_in_year(self, year: int) -> datetime:
+        """
+        Return the birthday occurrence in the given year.
+
+        A Feb 29 birthday is observed on Feb 28 in non-leap years.
+
+        Args:
+            year: Year of the occurrence
+
+        Returns:
+            Datetime of the birthday in that year
+        """
+        # Only the year changes; every other field is reused from the birth
+        if not self._is_feb29:
+            return self.birth_datetime.replace(year=year)
+
+        return self.birth_datetime.replace(year=year, day=29 if isleap(year) else 28)
+
+    def _update_birthdays(self, now: datetime) -> None:
+        """
+        Recompute the cached last/next birthdays unless they still bracket now.
+
+        Recomputing whenever now falls outside the cached range also covers
+        the clock stepping backward, not just the next birthday passing.
+
+        Args:
+            now: Current time
+        """
+        if (
+            self._last_birthday_dt is not None
+            and self._last_birthday_dt <= now < self._next_birthday_dt
+        ):
+            return
+
+        next_birthday = self._birthday_in_year(now.year)
+        if next_birthday <= now:
+            next_birthday = self._birthday_in_year(now.year + 1)
+
+        self._next_birthday_dt = next_birthday
+        self._last_birthday_dt = self._birthday_in_year(next_birthday.year - 1)
+        self._next_birthday_ts = next_birthday.timestamp()
+        self._last_birthday_ts = self._last_birthday_dt.timestamp()
+
+    def birthday_bounds(self, now: datetime) -> tuple[datetime, datetime]:
+        """
+        Return the datetimes of the last and next birthday.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Tuple of (last birthday, next birthday)
+        """
+        self._update_birthdays(now)
+        return self._last_birthday_dt, self._next_birthday_dt
+
+    def birthday_timestamps(self, now: datetime) -> tuple[float, float]:
+        """
+        Return the POSIX timestamps of the last and next birthday.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Tuple of (last birthday timestamp, next birthday timestamp)
+        """
+        self._update_birthdays(now)
+        return self._last_birthday_ts, self._next_birthday_ts
 
     async def _async_update_data(self) -> dict[str, Any]:
         """
@@ -128,9 +275,5 @@ class BirthdayProgressCoordinator(update_coordinator.DataUpdateCoordinator):
         Returns:
             Dictionary with current birthday data
         """
-        return {
-            "name": self.name,
-            "birth_date": self.birth_date,
-            "birth_time": self.birth_time,
-        }
+        return self._static_data
 
@@ -7,55 +7,92 @@ through the Home Assistant UI.
 from __future__ import annotations
 
 import logging
+import re
+from datetime import date, time
+from time import monotonic
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util import dt as dt_util
 
 from .const import CONF_BIRTH_DATE, CONF_BIRTH_TIME, CONF_NAME, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bound once; both are looked up on every validation
+_DT_NOW = dt_util.now
+_PARSE_TIME = dt_util.parse_time
 
-def parse_german_date(date_str: str) -> str:
+
+class InvalidDateError(ValueError):
+    """Error to indicate the birth date is invalid."""
+
+
+class FutureDateError(InvalidDateError):
+    """Error to indicate the birth date is in the future."""
+
+
+class InvalidTimeError(ValueError):
+    """Error to indicate the birth time is invalid."""
+
+
+_DATE_RE = re.compile(
+    r"^\s*(?:(\d{1,2})\.(\d{1,2})\.(\d{4})|(\d{4})-(\d{1,2})-(\d{1,2}))\s*$"
+)
+
+
+# (monotonic timestamp, date) of the last lookup in _today()
+_TODAY_CACHE: tuple[float, date] | None = None
+
+
+def _today() -> date:
+    """
+    Return the current local date, cached for up to one second.
+
+    Returns:
+        Current date in the Home Assistant time zone
     """
-    Parse German date format (DD.MM.YYYY) and convert to YYYY-MM-DD.
+    global _TODAY_CACHE
+
+    mono = monotonic()
+    if _TODAY_CACHE is not None and mono - _TODAY_CACHE[0] < 1.0:
+        return _TODAY_CACHE[1]
+
+    today = _DT_NOW().date()
+    _TODAY_CACHE = (mono, today)
+    return today
+
+
+def _parse_date(date_str: str) -> date:
+    """
+    Parse a date string in DD.MM.YYYY or YYYY-MM-DD format.
 
     Args:
         date_str: Date string in DD.MM.YYYY or YYYY-MM-DD format
 
     Returns:
-        Date string in YYYY-MM-DD format
+        Parsed date
 
     Raises:
-        ValueError: If date format is invalid
+        InvalidDateError: If date format or value is invalid
     """
-    date_str = date_str.strip()
-    
-    # Try German format DD.MM.YYYY first
-    if "." in date_str and len(date_str.split(".")) == 3:
-        try:
-            parts = date_str.split(".")
-            if len(parts) != 3:
-                raise ValueError("Invalid date format")
-            day, month, year = parts
-            # Convert to YYYY-MM-DD
-            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-        except (ValueError, IndexError) as err:
-            raise ValueError(f"Invalid German date format (DD.MM.YYYY): {err}") from err
-    
-    # Try ISO format YYYY-MM-DD (backwards compatibility)
-    if "-" in date_str and len(date_str.split("-")) == 3:
-        parts = date_str.split("-")
-        if len(parts) == 3 and len(parts[0]) == 4:
-            return date_str  # Already in YYYY-MM-DD format
-    
-    raise ValueError("Date must be in DD.MM.YYYY or YYYY-MM-DD format")
+    match = _DATE_RE.match(date_str)
+    if match is None:
+        raise InvalidDateError("Date must be in DD.MM.YYYY or YYYY-MM-DD format")
+
+    day, month, year, iso_year, iso_month, iso_day = match.groups()
+    if day is None:
+        year, month, day = iso_year, iso_month, iso_day
+
+    # The date constructor validates month and day ranges
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError as err:
+        raise InvalidDateError(f"Invalid date: {err}") from err
 
 
 def validate_date(date_str: str) -> str:
@@ -69,24 +106,32 @@ def validate_date(date_str: str) -> str:
         Date string in YYYY-MM-DD format
 
     Raises:
-        ValueError: If date format is invalid or date is in the future
+        InvalidDateError: If date format is invalid
+        FutureDateError: If date is in the future
     """
-    try:
-        # Convert to YYYY-MM-DD format
-        iso_date = parse_german_date(date_str)
-        
-        # Parse the ISO date
-        date_obj = dt_util.parse_date(iso_date)
-        if date_obj is None:
-            raise ValueError("Invalid date format")
-        
-        # Check if date is in the future
-        if date_obj > dt_util.now().date():
-            raise ValueError("Birth date cannot be in the future")
-        
-        return iso_date
-    except (ValueError, TypeError) as err:
-        raise ValueError(f"Invalid date format: {err}") from err
+    date_obj = _parse_date(date_str)
+
+    # Check if date is in the future
+    if date_obj > _today():
+        raise FutureDateError("Birth date cannot be in the future")
+
+    return date_obj.isoformat()
+
+
+def _iso_to_de(date_str: str) -> str:
+    """
+    Convert a YYYY-MM-DD date string to DD.MM.YYYY for display.
+
+    Args:
+        date_str: Date string, usually in YYYY-MM-DD format
+
+    Returns:
+        Date string in DD.MM.YYYY format, or the input unchanged if it is
+        not a YYYY-MM-DD string
+    """
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        return f"{date_str[8:10]}.{date_str[5:7]}.{date_str[:4]}"
+    return date_str
 
 
 def validate_time(time_str: str | None) -> bool:
@@ -97,18 +142,52 @@ def validate_time(time_str: str | None) -> bool:
         time_str: Time string to validate, or None
 
     Returns:
-        True if valid or None, raises ValueError otherwise
+        True if valid or None
+
+    Raises:
+        InvalidTimeError: If time format is invalid
     """
     if time_str is None or time_str == "":
         return True
 
+    # Fast path for canonical HH:MM and HH:MM:SS input; compact ISO forms
+    # such as "123000.5" are left to the Home Assistant parser, which the
+    # coordinator also uses and which rejects them
+    if len(time_str) in (5, 8) and time_str[2] == ":" and (
+        len(time_str) == 5 or time_str[5] == ":"
+    ):
+        try:
+            if time.fromisoformat(time_str).tzinfo is None:
+                return True
+        except ValueError:
+            pass
+
+    # Fall back to the more tolerant Home Assistant parser
     try:
-        time_obj = dt_util.parse_time(time_str)
-        if time_obj is None:
-            raise ValueError("Invalid time format")
-        return True
+        time_obj = _PARSE_TIME(time_str)
     except (ValueError, TypeError) as err:
-        raise ValueError(f"Invalid time format: {err}") from err
+        raise InvalidTimeError(f"Invalid time format: {err}") from err
+    if time_obj is None:
+        raise InvalidTimeError("Invalid time format")
+    return True
+
+
+# Form schemas are built once; current values are injected per render as
+# suggested values
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): str,
+        vol.Required(CONF_BIRTH_DATE): str,
+        vol.Optional(CONF_BIRTH_TIME): str,
+    }
+)
+
+_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_BIRTH_DATE): str,
+        vol.Optional(CONF_BIRTH_TIME): str,
+    }
+)
 
 
 class BirthdayProgressConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -118,6 +197,13 @@ class BirthdayProgressConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """
+        Initialize the config flow.
+        """
+        # (raw input, ISO date) of the last birth date that passed validation
+        self._validated_date: tuple[str, str] | None = None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -132,27 +218,44 @@ class BirthdayProgressConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """
         errors: dict[str, str] = {}
 
+        # Submitted values, read once for validation and for re-rendering
+        name_in = date_in = time_in = ""
         if user_input is not None:
+            name_in = user_input.get(CONF_NAME, "")
+            date_in = user_input.get(CONF_BIRTH_DATE, "")
+            time_in = user_input.get(CONF_BIRTH_TIME, "")
+
             try:
                 # Validate name
-                name = user_input.get(CONF_NAME, "").strip()
+                name = name_in.strip()
                 if not name:
                     errors[CONF_NAME] = "name_required"
 
                 # Validate date and convert to ISO format
-                birth_date = user_input.get(CONF_BIRTH_DATE, "")
+                birth_date = date_in
                 if not birth_date:
                     errors[CONF_BIRTH_DATE] = "date_required"
+                elif self._validated_date and self._validated_date[0] == birth_date:
+                    # Unchanged since an earlier submission of this form
+                    birth_date = self._validated_date[1]
                 else:
                     try:
-                        birth_date = validate_date(birth_date)  # Returns ISO format
-                    except ValueError:
+                        iso_date = validate_date(birth_date)
+                    except FutureDateError:
+                        errors[CONF_BIRTH_DATE] = "future_date"
+                    except InvalidDateError:
                         errors[CONF_BIRTH_DATE] = "invalid_date"
+                    else:
+                        self._validated_date = (birth_date, iso_date)
+                        birth_date = iso_date
 
                 # Validate time (optional)
-                birth_time = user_input.get(CONF_BIRTH_TIME, "")
+                birth_time = time_in
                 if birth_time:
-                    validate_time(birth_time)
+                    try:
+                        validate_time(birth_time)
+                    except InvalidTimeError:
+                        errors[CONF_BIRTH_TIME] = "invalid_time"
                 else:
                     birth_time = None
 
@@ -171,39 +274,21 @@ class BirthdayProgressConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         },
                     )
 
-            except ValueError as err:
-                _LOGGER.error("Validation error: %s", err)
-                if "date" in str(err).lower():
-                    errors[CONF_BIRTH_DATE] = "invalid_date"
-                elif "time" in str(err).lower():
-                    errors[CONF_BIRTH_TIME] = "invalid_time"
-                elif "future" in str(err).lower():
-                    errors[CONF_BIRTH_DATE] = "future_date"
             except Exception as err:
                 _LOGGER.exception("Unexpected error: %s", err)
                 errors["base"] = "unknown"
 
         # Show form
         # Convert stored ISO date back to German format for display
-        display_date = ""
-        if user_input and user_input.get(CONF_BIRTH_DATE):
-            stored_date = user_input.get(CONF_BIRTH_DATE)
-            # If it's in ISO format, convert to German format for display
-            if "-" in stored_date and len(stored_date.split("-")) == 3:
-                parts = stored_date.split("-")
-                if len(parts[0]) == 4:  # YYYY-MM-DD
-                    display_date = f"{parts[2]}.{parts[1]}.{parts[0]}"
-                else:
-                    display_date = stored_date
-            else:
-                display_date = stored_date
-        
-        data_schema = vol.Schema(
+        display_date = _iso_to_de(date_in) if date_in else ""
+
+        data_schema = self.add_suggested_values_to_schema(
+            _USER_SCHEMA,
             {
-                vol.Required(CONF_NAME, default=user_input.get(CONF_NAME, "") if user_input else ""): str,
-                vol.Required(CONF_BIRTH_DATE, default=display_date, description={"suffix": "Format: DD.MM.YYYY"}): str,
-                vol.Optional(CONF_BIRTH_TIME, default=user_input.get(CONF_BIRTH_TIME, "") if user_input else ""): str,
-            }
+                CONF_NAME: name_in,
+                CONF_BIRTH_DATE: display_date,
+                CONF_BIRTH_TIME: time_in,
+            },
         )
 
         return self.async_show_form(
@@ -276,13 +361,18 @@ class BirthdayProgressOptionsFlow(config_entries.OptionsFlow):
                 else:
                     try:
                         birth_date = validate_date(birth_date)  # Returns ISO format
-                    except ValueError:
+                    except FutureDateError:
+                        errors[CONF_BIRTH_DATE] = "future_date"
+                    except InvalidDateError:
                         errors[CONF_BIRTH_DATE] = "invalid_date"
 
                 # Validate time (optional)
                 birth_time = user_input.get(CONF_BIRTH_TIME, "")
                 if birth_time:
-                    validate_time(birth_time)
+                    try:
+                        validate_time(birth_time)
+                    except InvalidTimeError:
+                        errors[CONF_BIRTH_TIME] = "invalid_time"
                 else:
                     birth_time = None
 
@@ -298,14 +388,6 @@ class BirthdayProgressOptionsFlow(config_entries.OptionsFlow):
                     )
                     return self.async_create_entry(title="", data={})
 
-            except ValueError as err:
-                _LOGGER.error("Validation error: %s", err)
-                if "date" in str(err).lower():
-                    errors[CONF_BIRTH_DATE] = "invalid_date"
-                elif "time" in str(err).lower():
-                    errors[CONF_BIRTH_TIME] = "invalid_time"
-                elif "future" in str(err).lower():
-                    errors[CONF_BIRTH_DATE] = "future_date"
             except Exception as err:
                 _LOGGER.exception("Unexpected error: %s", err)
                 errors["base"] = "unknown"
@@ -313,26 +395,14 @@ class BirthdayProgressOptionsFlow(config_entries.OptionsFlow):
         # Show form with current values
         current_data = self.config_entry.data
         # Convert stored ISO date back to German format for display
-        stored_date = current_data.get(CONF_BIRTH_DATE, "")
-        display_date = ""
-        if stored_date and "-" in stored_date:
-            parts = stored_date.split("-")
-            if len(parts) == 3 and len(parts[0]) == 4:  # YYYY-MM-DD
-                display_date = f"{parts[2]}.{parts[1]}.{parts[0]}"
-            else:
-                display_date = stored_date
-        else:
-            display_date = stored_date
-        
-        data_schema = vol.Schema(
+        display_date = _iso_to_de(current_data.get(CONF_BIRTH_DATE, ""))
+
+        data_schema = self.add_suggested_values_to_schema(
+            _OPTIONS_SCHEMA,
             {
-                vol.Required(
-                    CONF_BIRTH_DATE, default=display_date, description={"suffix": "Format: DD.MM.YYYY"}
-                ): str,
-                vol.Optional(
-                    CONF_BIRTH_TIME, default=current_data.get(CONF_BIRTH_TIME, "")
-                ): str,
-            }
+                CONF_BIRTH_DATE: display_date,
+                CONF_BIRTH_TIME: current_data.get(CONF_BIRTH_TIME) or "",
+            },
         )
 
         return self.async_show_form(
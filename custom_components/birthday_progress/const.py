@@ -13,6 +13,7 @@ CONF_NAME = "name"
 CONF_BIRTH_DATE = "birth_date"
 CONF_BIRTH_TIME = "birth_time"
 
-DEFAULT_UPDATE_INTERVAL = 1  # Update every second
+# Display format for the birth and next birthday datetimes
+DATETIME_FORMAT = "%d/%m/%Y %H:%M:%S"
 
 
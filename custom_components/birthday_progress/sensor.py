@@ -7,13 +7,15 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
@@ -23,11 +25,54 @@ from .const import (
     ATTR_NEXT_BIRTHDAY,
     ATTR_PROGRESS_PERCENTAGE,
     ATTR_TIME_UNTIL_NEXT,
+    DATETIME_FORMAT,
     DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds per unit; months and years are approximated as 30 and 365 days
+_SPM = 60
+_SPH = 3600
+_SPD = 86_400
+_SPW = 604_800
+_SPMO_APPROX = 2_592_000
+_SPY_APPROX = 31_536_000
+
+# (breakdown key, singular, plural) in display order
+_TIME_UNITS = (
+    ("years", "year", "years"),
+    ("months", "month", "months"),
+    ("weeks", "week", "weeks"),
+    ("days", "day", "days"),
+    ("hours", "hour", "hours"),
+    ("minutes", "minute", "minutes"),
+    ("seconds", "second", "seconds"),
+)
+
+
+@lru_cache(maxsize=64)
+def _breakdown_seconds(total_s: int) -> tuple[int, int, int, int, int, int, int]:
+    """
+    Break a number of seconds down into calendar-like units.
+
+    Sensors sharing a coordinator ask for the same values within the same
+    second, so recent results are cached.
+
+    Args:
+        total_s: Number of whole seconds
+
+    Returns:
+        Tuple of (years, months, weeks, days, hours, minutes, seconds)
+    """
+    years, remainder = divmod(total_s, _SPY_APPROX)
+    months, remainder = divmod(remainder, _SPMO_APPROX)
+    weeks, remainder = divmod(remainder, _SPW)
+    days, remainder = divmod(remainder, _SPD)
+    hours, remainder = divmod(remainder, _SPH)
+    minutes, seconds = divmod(remainder, _SPM)
+    return years, months, weeks, days, hours, minutes, seconds
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -42,7 +87,7 @@ async def async_setup_entry(
         entry: Configuration entry
         async_add_entities: Callback to add entities
     """
-    coordinator: BirthdayProgressCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: BirthdayProgressCoordinator = hass.data[DOMAIN].coordinators[entry.entry_id]
 
     async_add_entities([BirthdayProgressSensor(coordinator, entry)])
 
@@ -59,6 +104,23 @@ class BirthdayProgressSensor(
     - Progress percentage toward next birthday
     """
 
+    # Only this class's own attributes; the Home Assistant base classes keep
+    # their __dict__
+    __slots__ = (
+        "_entry",
+        "_name",
+        "_birth_date_str",
+        "_birth_time_str",
+        "_unsub_tick",
+        "_birth_datetime",
+        "_birth_datetime_str",
+        "_ha_tz",
+        "_next_birthday_strs",
+        "_tsb_day_key",
+        "_tsb_upper",
+        "_cached_state",
+    )
+
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "%"
 
@@ -77,9 +139,26 @@ class BirthdayProgressSensor(
         self._name = entry.data.get("name", "Unknown")
         self._birth_date_str = entry.data.get("birth_date")
         self._birth_time_str = entry.data.get("birth_time")
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+        # Birth datetime is parsed once by the coordinator
+        self._birth_datetime = coordinator.birth_datetime
+        self._birth_datetime_str = self._birth_datetime.strftime(DATETIME_FORMAT)
+
+        # Time zone the birth datetime was localized to; reading the clock in
+        # the same zone keeps differences in wall-clock time
+        self._ha_tz = self._birth_datetime.tzinfo
+
+        # (next birthday, ISO string, display string); reformatted on rollover
+        self._next_birthday_strs: tuple[datetime, str, str] | None = None
 
-        # Parse birth datetime
-        self._birth_datetime = self._parse_birth_datetime()
+        # Whole days since birth and the (years, months, weeks, days) breakdown
+        # of that many days; these only change once a day
+        self._tsb_day_key: int | None = None
+        self._tsb_upper: tuple[int, int, int, int] = (0, 0, 0, 0)
+
+        # Values for the current update; cleared before each new state write
+        self._cached_state: dict[str, Any] | None = None
 
         # Entity attributes
         # Set name to generate entity_id: sensor.<name>_birthday_progress
@@ -89,42 +168,17 @@ class BirthdayProgressSensor(
         self._attr_icon = "mdi:cake-variant"
         # Entity ID format: sensor.<slugified_name>_birthday_progress
 
-    def _parse_birth_datetime(self) -> datetime:
-        """
-        Parse birth date and time into a datetime object.
-
-        Returns:
-            Datetime object representing birth date/time
-        """
-        birth_date = dt_util.parse_date(self._birth_date_str)
-        if birth_date is None:
-            raise ValueError(f"Invalid birth date: {self._birth_date_str}")
-
-        birth_time = None
-        if self._birth_time_str:
-            birth_time = dt_util.parse_time(self._birth_time_str)
-            if birth_time is None:
-                _LOGGER.warning(
-                    "Invalid birth time format: %s, using midnight", self._birth_time_str
-                )
-
-        # Combine date and time, defaulting to midnight if no time provided
-        if birth_time is not None:
-            return dt_util.as_local(
-                datetime.combine(birth_date, birth_time)
-            )
-        return dt_util.as_local(datetime.combine(birth_date, datetime.min.time()))
-
-    def _calculate_age_exact(self) -> str:
+    def _calculate_age_exact(self, now: datetime, last_birthday: datetime) -> str:
         """
         Calculate exact age as a formatted string.
 
+        Args:
+            now: Current time
+            last_birthday: Datetime of the last birthday
+
         Returns:
             Formatted age string (e.g., "27y 153d 04:12:10")
         """
-        now = dt_util.now()
-        last_birthday = self._calculate_last_birthday()
-        
         # Calculate time since last birthday
         time_since_last_birthday = now - last_birthday
         
@@ -133,98 +187,40 @@ class BirthdayProgressSensor(
         
         # Extract days, hours, minutes, seconds
         days = time_since_last_birthday.days
-        hours, remainder = divmod(time_since_last_birthday.seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
+        hours, remainder = divmod(time_since_last_birthday.seconds, _SPH)
+        minutes, seconds = divmod(remainder, _SPM)
 
-        return f"{years}y {days}d {hours:02d}:{minutes:02d}:{seconds:02d}"
+        return "%dy %dd %02d:%02d:%02d" % (years, days, hours, minutes, seconds)
 
-    def _calculate_next_birthday(self) -> datetime:
+    def _get_birthday_bounds(self, now: datetime) -> tuple[datetime, datetime]:
         """
-        Calculate the datetime of the next birthday.
+        Get the last and next birthday around the given time.
+
+        Both are cached by the coordinator until the next birthday passes.
+
+        Args:
+            now: Current time
 
         Returns:
-            Datetime of next birthday
-        """
-        now = dt_util.now()
-        current_year = now.year
-
-        # Get birth month and day
-        birth_month = self._birth_datetime.month
-        birth_day = self._birth_datetime.day
-
-        # Try current year first
-        try:
-            next_birthday = datetime(
-                current_year,
-                birth_month,
-                birth_day,
-                self._birth_datetime.hour,
-                self._birth_datetime.minute,
-                self._birth_datetime.second,
-                tzinfo=self._birth_datetime.tzinfo,
-            )
-            if next_birthday <= now:
-                # Birthday already passed this year, next year
-                next_birthday = next_birthday.replace(year=current_year + 1)
-        except ValueError:
-            # Handle Feb 29 edge case
-            if birth_month == 2 and birth_day == 29:
-                # Find next valid Feb 29 or use Feb 28
-                for year in [current_year, current_year + 1]:
-                    try:
-                        next_birthday = datetime(
-                            year,
-                            2,
-                            29,
-                            self._birth_datetime.hour,
-                            self._birth_datetime.minute,
-                            self._birth_datetime.second,
-                            tzinfo=self._birth_datetime.tzinfo,
-                        )
-                        if next_birthday > now:
-                            break
-                    except ValueError:
-                        continue
-                else:
-                    # No valid Feb 29 found, use Feb 28
-                    next_birthday = datetime(
-                        current_year + 1,
-                        2,
-                        28,
-                        self._birth_datetime.hour,
-                        self._birth_datetime.minute,
-                        self._birth_datetime.second,
-                        tzinfo=self._birth_datetime.tzinfo,
-                    )
-            else:
-                next_birthday = datetime(
-                    current_year + 1,
-                    birth_month,
-                    birth_day,
-                    self._birth_datetime.hour,
-                    self._birth_datetime.minute,
-                    self._birth_datetime.second,
-                    tzinfo=self._birth_datetime.tzinfo,
-                )
-
-        return dt_util.as_local(next_birthday)
-
-    def _calculate_time_until_next(self) -> str:
+            Tuple of (last birthday, next birthday)
+        """
+        return self.coordinator.birthday_bounds(now)
+
+    def _calculate_time_until_next(self, time_delta: timedelta) -> str:
         """
         Calculate time until next birthday as formatted string.
 
+        Args:
+            time_delta: Time remaining until the next birthday
+
         Returns:
             Formatted time string (e.g., "45 days, 12:34:56")
         """
-        now = dt_util.now()
-        next_birthday = self._calculate_next_birthday()
-        time_delta = next_birthday - now
-
         days = time_delta.days
-        hours, remainder = divmod(time_delta.seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
+        hours, remainder = divmod(time_delta.seconds, _SPH)
+        minutes, seconds = divmod(remainder, _SPM)
 
-        return f"{days} days, {hours:02d}:{minutes:02d}:{seconds:02d}"
+        return "%d days, %02d:%02d:%02d" % (days, hours, minutes, seconds)
 
     def _calculate_detailed_time_breakdown(self, time_delta: timedelta) -> dict[str, int]:
         """
@@ -236,35 +232,35 @@ class BirthdayProgressSensor(
         Returns:
             Dictionary with years, months, weeks, days, hours, minutes, seconds
         """
-        total_seconds = int(time_delta.total_seconds())
-        total_days = time_delta.days
+        breakdown = _breakdown_seconds(int(time_delta.total_seconds()))
+        return {key: value for (key, _, _), value in zip(_TIME_UNITS, breakdown)}
+
+    def _calculate_time_since_birth(self, time_since_birth: timedelta) -> dict[str, int]:
+        """
+        Calculate the detailed time breakdown since birth.
 
-        # Calculate years (approximate)
-        years = total_days // 365
-        remaining_days = total_days % 365
+        Every unit above hours is a whole number of days, so that part is
+        only recomputed when the number of days since birth changes.
 
-        # Calculate months (approximate, using 30.44 days per month average)
-        months = remaining_days // 30
-        remaining_days_after_months = remaining_days % 30
+        Args:
+            time_since_birth: Time elapsed since birth
 
-        # Calculate weeks
-        weeks = remaining_days_after_months // 7
-        days = remaining_days_after_months % 7
+        Returns:
+            Dictionary with years, months, weeks, days, hours, minutes, seconds
+        """
+        day_key = time_since_birth.days
+        if day_key < 0:
+            return self._calculate_detailed_time_breakdown(time_since_birth)
 
-        # Calculate hours, minutes, seconds
-        hours = (total_seconds % 86400) // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
+        if day_key != self._tsb_day_key:
+            self._tsb_upper = _breakdown_seconds(day_key * _SPD)[:4]
+            self._tsb_day_key = day_key
 
-        return {
-            "years": years,
-            "months": months,
-            "weeks": weeks,
-            "days": days,
-            "hours": hours,
-            "minutes": minutes,
-            "seconds": seconds,
-        }
+        hours, remainder = divmod(time_since_birth.seconds, _SPH)
+        minutes, seconds = divmod(remainder, _SPM)
+
+        breakdown = (*self._tsb_upper, hours, minutes, seconds)
+        return {key: value for (key, _, _), value in zip(_TIME_UNITS, breakdown)}
 
     def _format_detailed_time(self, breakdown: dict[str, int]) -> str:
         """
@@ -276,22 +272,11 @@ class BirthdayProgressSensor(
         Returns:
             Formatted string (e.g., "8 years, 2 months, 1 week, 4 days, 23 hours, 34 minutes, and 8 seconds")
         """
-        parts = []
-        
-        if breakdown["years"] > 0:
-            parts.append(f"{breakdown['years']} year{'s' if breakdown['years'] != 1 else ''}")
-        if breakdown["months"] > 0:
-            parts.append(f"{breakdown['months']} month{'s' if breakdown['months'] != 1 else ''}")
-        if breakdown["weeks"] > 0:
-            parts.append(f"{breakdown['weeks']} week{'s' if breakdown['weeks'] != 1 else ''}")
-        if breakdown["days"] > 0:
-            parts.append(f"{breakdown['days']} day{'s' if breakdown['days'] != 1 else ''}")
-        if breakdown["hours"] > 0:
-            parts.append(f"{breakdown['hours']} hour{'s' if breakdown['hours'] != 1 else ''}")
-        if breakdown["minutes"] > 0:
-            parts.append(f"{breakdown['minutes']} minute{'s' if breakdown['minutes'] != 1 else ''}")
-        if breakdown["seconds"] > 0 or len(parts) == 0:
-            parts.append(f"{breakdown['seconds']} second{'s' if breakdown['seconds'] != 1 else ''}")
+        parts = [
+            f"{value} {singular if value == 1 else plural}"
+            for key, singular, plural in _TIME_UNITS
+            if (value := breakdown[key]) > 0
+        ]
 
         if len(parts) == 0:
             return "0 seconds"
@@ -302,105 +287,136 @@ class BirthdayProgressSensor(
         else:
             return ", ".join(parts[:-1]) + ", and " + parts[-1]
 
-    def _calculate_progress_percentage(self) -> float:
+    def _calculate_progress_percentage(self, now: datetime) -> float:
         """
         Calculate progress percentage toward next birthday (0-100).
 
+        Args:
+            now: Current time
+
         Returns:
             Progress percentage as float (0.0-100.0)
         """
-        now = dt_util.now()
-        next_birthday = self._calculate_next_birthday()
-
-        # Calculate last birthday
-        last_birthday = self._calculate_last_birthday()
-
-        # Total time between last and next birthday
-        total_time = (next_birthday - last_birthday).total_seconds()
-
-        # Time elapsed since last birthday
-        elapsed_time = (now - last_birthday).total_seconds()
+        # Birthday timestamps are cached by the coordinator, so only the
+        # current time needs converting
+        last_ts, next_ts = self.coordinator.birthday_timestamps(now)
+        total_time = next_ts - last_ts
 
         # Calculate percentage
         if total_time > 0:
-            progress = (elapsed_time / total_time) * 100.0
+            progress = ((now.timestamp() - last_ts) / total_time) * 100.0
             return round(progress, 4)
         return 0.0
 
-    def _calculate_last_birthday(self) -> datetime:
+    def _format_next_birthday(self, next_birthday: datetime) -> tuple[str, str]:
         """
-        Calculate the datetime of the last birthday.
+        Format the next birthday, reusing the cached strings until it changes.
+
+        Args:
+            next_birthday: Datetime of the next birthday
 
         Returns:
-            Datetime of last birthday
-        """
-        now = dt_util.now()
-        current_year = now.year
-
-        birth_month = self._birth_datetime.month
-        birth_day = self._birth_datetime.day
-
-        # Try current year first
-        try:
-            last_birthday = datetime(
-                current_year,
-                birth_month,
-                birth_day,
-                self._birth_datetime.hour,
-                self._birth_datetime.minute,
-                self._birth_datetime.second,
-                tzinfo=self._birth_datetime.tzinfo,
+            Tuple of (ISO string, display string)
+        """
+        cached = self._next_birthday_strs
+        if cached is None or cached[0] != next_birthday:
+            cached = self._next_birthday_strs = (
+                next_birthday,
+                next_birthday.isoformat(),
+                next_birthday.strftime(DATETIME_FORMAT),
             )
-            if last_birthday > now:
-                # Birthday hasn't occurred this year yet, last year
-                last_birthday = last_birthday.replace(year=current_year - 1)
-        except ValueError:
-            # Handle Feb 29 edge case
-            if birth_month == 2 and birth_day == 29:
-                # Find last valid Feb 29 or use Feb 28
-                for year in range(current_year, current_year - 2, -1):
-                    try:
-                        last_birthday = datetime(
-                            year,
-                            2,
-                            29,
-                            self._birth_datetime.hour,
-                            self._birth_datetime.minute,
-                            self._birth_datetime.second,
-                            tzinfo=self._birth_datetime.tzinfo,
-                        )
-                        if last_birthday <= now:
-                            break
-                    except ValueError:
-                        continue
-                else:
-                    # No valid Feb 29 found, use Feb 28
-                    last_birthday = datetime(
-                        current_year - 1,
-                        2,
-                        28,
-                        self._birth_datetime.hour,
-                        self._birth_datetime.minute,
-                        self._birth_datetime.second,
-                        tzinfo=self._birth_datetime.tzinfo,
-                    )
-            else:
-                last_birthday = datetime(
-                    current_year - 1,
-                    birth_month,
-                    birth_day,
-                    self._birth_datetime.hour,
-                    self._birth_datetime.minute,
-                    self._birth_datetime.second,
-                    tzinfo=self._birth_datetime.tzinfo,
-                )
-
-        return dt_util.as_local(last_birthday)
+        return cached[1], cached[2]
+
+    def _compute_state(self, now: datetime) -> dict[str, Any]:
+        """
+        Compute all sensor values for a single point in time.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Dictionary of state attributes, including the progress percentage
+        """
+        last_birthday, next_birthday = self._get_birthday_bounds(now)
+        next_birthday_iso, next_birthday_str = self._format_next_birthday(next_birthday)
+
+        # Calculate time since birth
+        time_since_birth = now - self._birth_datetime
+        time_since_breakdown = self._calculate_time_since_birth(time_since_birth)
+
+        # Calculate time until next birthday
+        time_until_next = next_birthday - now
+        time_until_breakdown = self._calculate_detailed_time_breakdown(time_until_next)
+
+        return {
+            ATTR_AGE_EXACT: self._calculate_age_exact(now, last_birthday),
+            ATTR_NEXT_BIRTHDAY: next_birthday_iso,
+            ATTR_TIME_UNTIL_NEXT: self._calculate_time_until_next(time_until_next),
+            ATTR_PROGRESS_PERCENTAGE: self._calculate_progress_percentage(now),
+            "name": self._name,
+            "birth_date": self._birth_date_str,
+            "birth_time": self._birth_time_str or "Not specified",
+            "birth_datetime": self._birth_datetime_str,
+            "next_birthday_datetime": next_birthday_str,
+            "time_since_birth": self._format_detailed_time(time_since_breakdown),
+            "time_until_next_detailed": self._format_detailed_time(time_until_breakdown),
+        }
+
+    def _get_state(self) -> dict[str, Any]:
+        """
+        Get the values for the current update, computing them on first use.
+
+        Returns:
+            Dictionary of state attributes, including the progress percentage
+        """
+        if self._cached_state is None:
+            self._cached_state = self._compute_state(datetime.now(self._ha_tz))
+        return self._cached_state
+
+    async def async_added_to_hass(self) -> None:
+        """Start the per-second state updates once the entity is added."""
+        await super().async_added_to_hass()
+        self._schedule_tick(dt_util.utcnow())
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending state update when the entity is removed."""
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+        await super().async_will_remove_from_hass()
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+    def _schedule_tick(self, now: datetime) -> None:
+        """
+        Schedule the next state update on the next whole second.
+
+        Args:
+            now: Current time
+        """
+        next_second = now.replace(microsecond=0) + timedelta(seconds=1)
+        self._unsub_tick = async_track_point_in_time(
+            self.hass, self._tick, next_second
+        )
+
+    @callback
+    def _tick(self, now: datetime) -> None:
+        """
+        Write the current state and schedule the next update.
+
+        Args:
+            now: Time the update was scheduled for
+        """
+        self._cached_state = None
         self.async_write_ha_state()
+        # Reschedule from the actual time: "now" is the scheduled point, so
+        # after a stalled event loop it would queue a burst of past ticks
+        self._schedule_tick(dt_util.utcnow())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop cached values before the base class writes the new state."""
+        self._cached_state = None
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> float:
@@ -410,7 +426,7 @@ class BirthdayProgressSensor(
         Returns:
             Progress percentage (0-100)
         """
-        return self._calculate_progress_percentage()
+        return self._get_state()[ATTR_PROGRESS_PERCENTAGE]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -420,31 +436,7 @@ class BirthdayProgressSensor(
         Returns:
             Dictionary of extra attributes
         """
-        now = dt_util.now()
-        next_birthday = self._calculate_next_birthday()
-        last_birthday = self._calculate_last_birthday()
-        
-        # Calculate time since birth
-        time_since_birth = now - self._birth_datetime
-        time_since_breakdown = self._calculate_detailed_time_breakdown(time_since_birth)
-        
-        # Calculate time until next birthday
-        time_until_next = next_birthday - now
-        time_until_breakdown = self._calculate_detailed_time_breakdown(time_until_next)
-        
-        return {
-            ATTR_AGE_EXACT: self._calculate_age_exact(),
-            ATTR_NEXT_BIRTHDAY: next_birthday.isoformat(),
-            ATTR_TIME_UNTIL_NEXT: self._calculate_time_until_next(),
-            ATTR_PROGRESS_PERCENTAGE: self._calculate_progress_percentage(),
-            "name": self._name,
-            "birth_date": self._birth_date_str,
-            "birth_time": self._birth_time_str or "Not specified",
-            "birth_datetime": self._birth_datetime.strftime("%d/%m/%Y %H:%M:%S"),
-            "next_birthday_datetime": next_birthday.strftime("%d/%m/%Y %H:%M:%S"),
-            "time_since_birth": self._format_detailed_time(time_since_breakdown),
-            "time_until_next_detailed": self._format_detailed_time(time_until_breakdown),
-        }
+        return self._get_state()
 
     @property
     def device_info(self) -> DeviceInfo: